@@ -1,3 +1,5 @@
+import hashlib
+import json
 import os
 import re
 from collections import defaultdict
@@ -7,9 +9,12 @@ from dateutil.rrule import rrulestr
 from icalendar import Calendar, vRecur
 import pytz
 
+# 스냅샷 형식 버전. 스냅샷 구조나 섹션 본문 형식(_render_section_body)이 바뀌면 올려서 이전 캐시를 무효화
+SNAPSHOT_VERSION = 2
+
 
 class CalendarFormatter:
-    def __init__(self, directory_path, region_keyword_map, seminar_keywords):
+    def __init__(self, directory_path, region_keyword_map, seminar_keywords, snapshot_path=None):
         self.directory_path = directory_path
         self.region_keyword_map = region_keyword_map
         self.seminar_keywords = seminar_keywords
@@ -17,6 +22,11 @@ class CalendarFormatter:
         self.korean_weekday = ['월', '화', '수', '목', '금', '토', '일']
         self.weekday_map = {'MO': '월', 'TU': '화', 'WE': '수', 'TH': '목', 'FR': '금', 'SA': '토', 'SU': '일'}
         self.region_order = list(region_keyword_map.keys())
+        # 이전 실행 결과를 저장해 두는 파일 경로 (None이면 스냅샷을 사용하지 않음)
+        self.snapshot_path = snapshot_path
+        self.last_diff = None
+        # 마지막으로 생성한 결과를 타래 게시물 단위로 나눈 목록
+        self.last_sections = None
 
     def _get_week_of_month(self, dt):
         start_of_week = dt - timedelta(days=dt.weekday())
@@ -77,7 +87,146 @@ class CalendarFormatter:
             'is_all_day': is_all_day,
         }
 
-    def _generate_output_string(self, structured_events, start_date_utc, end_date_utc):
+    def _recurrence_text(self, representative_event, occurrence_count):
+        #  RRULE 객체가 있는지 확인하여 반복 정보 생성
+        rrule_obj = representative_event.get('rrule_obj')
+        if rrule_obj:
+            # RRULE이 있으면 요일 정보로 포맷팅
+            recurrence_text = self._format_rrule_for_display(rrule_obj)
+            # 포맷팅 결과가 비어있을 경우, 횟수 정보로 대체
+            if not recurrence_text.strip():
+                recurrence_text = f"(기간 내 {occurrence_count}회 반복) "
+        else:
+            # RRULE이 없으면 횟수 정보로 표시
+            recurrence_text = f"(기간 내 {occurrence_count}회 반복) "
+        return recurrence_text
+
+    def _group_occurrence_blocks(self, occurrence_blocks):
+        """
+        일정별 발생 시각 목록을 발생 건마다 펼치지 않고 그룹화하여 '반복'과 '단일'로 분류.
+        그룹(제목, 장소, 지역, 타입)별로 첫 블록과 발생 횟수만 집계
+        """
+        # 동일한 이벤트를 그룹화 (제목, 장소, 지역, 타입으로 고유한 이벤트를 식별)
+        grouped_blocks = {}
+        for block in occurrence_blocks:
+            event_details, occurrence_times, _ = block
+            event_key = (event_details['title'], event_details['location'], event_details['region_group'],
+                         event_details['event_type'])
+            group = grouped_blocks.get(event_key)
+            if group is None:
+                grouped_blocks[event_key] = [block, len(occurrence_times), occurrence_times]
+            else:
+                group[1] += len(occurrence_times)
+                group[2] = group[2] + occurrence_times
+
+        # 그룹화된 이벤트를 '반복'과 '단일'로 최종 분류
+        structured_events = defaultdict(lambda: defaultdict(lambda: {'recurring': [], 'single': []}))
+        for (_, _, region_group, event_type), (first_block, occurrence_count, all_times) in grouped_blocks.items():
+            # 그룹의 첫 발생 건을 대표 일정으로 사용
+            event_details, occurrence_times, rrule = first_block
+            if rrule is None:
+                representative_event = event_details
+            else:
+                representative_event = event_details.copy()
+                # [수정] RRULE 객체를 이벤트 정보에 추가
+                representative_event['rrule_obj'] = rrule
+            representative_event['start_time'] = occurrence_times[0].astimezone(self.display_timezone)
+            # 스냅샷 비교용: 그룹의 기간 내 모든 발생 시각(UTC)
+            representative_event['occurrence_times'] = all_times
+
+            # 발생 횟수가 2번 이상이면 '반복'으로 처리
+            if occurrence_count >= 2:
+                representative_event['recurrence_info'] = self._recurrence_text(representative_event, occurrence_count)
+                structured_events[region_group][event_type]['recurring'].append(representative_event)
+            # 발생 횟수가 1번이면 '단일'로 처리
+            else:
+                structured_events[region_group][event_type]['single'].append(representative_event)
+        return structured_events
+
+    def _section_snapshot(self, region_name, event_type, week_num, month, recurring_events, single_events):
+        """
+        섹션 본문 캐시용 해시와 diff용 일정 목록을 생성.
+        문자열 포맷팅 없이 그룹화된 값(제목, 장소, 시작 시각, 반복 정보)만 사용
+        """
+        hash_items = [SNAPSHOT_VERSION, region_name, event_type, week_num, month]
+        event_records = []
+        for events in (recurring_events, single_events):
+            for event in events:
+                start_time = event['start_time']
+                hash_items.append((event['title'], event['location'], event['url'], event['is_all_day'],
+                                   event.get('recurrence_info'), start_time.toordinal(), start_time.hour,
+                                   start_time.minute, start_time.second))
+                # 반복/단일 구분과 첫 날짜는 조회 기간에 따라 달라지므로, 기간과 무관한 값과
+                # 기간 내 발생 시각(UTC 기준 분)만 저장해 겹치는 구간의 발생 건끼리 비교.
+                # occurrence_times는 모두 UTC이므로 timestamp() 대신 필드로 직접 계산 (훨씬 빠름)
+                fingerprint = [event['url'], event['is_all_day']]
+                occurrence_minutes = [t.toordinal() * 1440 + t.hour * 60 + t.minute
+                                      for t in event['occurrence_times']]
+                occurrence_minutes.sort()
+                event_records.append([event['title'], event['location'], fingerprint, occurrence_minutes])
+
+        section_hash = hashlib.sha256(repr(hash_items).encode('utf-8')).hexdigest()
+        return section_hash, event_records
+
+    def _render_section_body(self, event_type, display_region_name, week_num, month, recurring_events, single_events):
+        """지역/타입별 게시물에서 순번 줄을 제외한 본문을 생성"""
+        type_icon = "🔥" if event_type == '투쟁' else "📓"
+        type_text = "투쟁" if event_type == '투쟁' else "세미나"
+
+        output_parts = [
+            f"{month}월 {week_num}주차 ({display_region_name} {type_text})\n",
+            f"{type_icon}{type_text}일정 안내{type_icon}\n",
+        ]
+
+        if recurring_events:
+            date_icon = "✊" if event_type == '투쟁' else "📓"
+            output_parts.append(f"📢 {week_num}주차 반복일정 {date_icon}\n")
+
+            # 반복 일정은 시작 시간으로 정렬
+            sorted_recurring = sorted(recurring_events, key=lambda e: e['start_time'])
+
+            for event in sorted_recurring:
+                # [수정] 생성된 반복 정보를 그대로 사용
+                recurrence_text = event.get('recurrence_info', '(반복) ')
+
+                time_str = ""
+                if not event['is_all_day']:
+                    time_str = f"{event['start_time'].strftime('%H:%M')} "
+
+                output_parts.append(f"↓ {event['title']}")
+                output_parts.append(f"{recurrence_text}{time_str}{event['location']}")
+
+                if event['url']:
+                    output_parts.append(f"{event['url']}\n")
+                else:
+                    output_parts.append("\n")
+
+        if single_events:
+            events_by_date = defaultdict(list)
+            for e in single_events:
+                events_by_date[e['start_time'].date()].append(e)
+
+            for event_date in sorted(events_by_date.keys()):
+                day_str = self.korean_weekday[event_date.weekday()]
+                date_icon = "✊" if event_type == '투쟁' else "📓"
+                output_parts.append(f"📢 {event_date.month}월 {event_date.day}일 ({day_str}) {date_icon}\n")
+
+                sorted_day_events = sorted(events_by_date[event_date], key=lambda x: x['start_time'])
+                for event in sorted_day_events:
+                    output_parts.append(f"↓ {event['title']}")
+                    if event['is_all_day']:
+                        output_parts.append(f"{event['location']}")
+                    else:
+                        output_parts.append(f"{event['start_time'].strftime('%H:%M')} {event['location']}")
+
+                    if event['url']:
+                        output_parts.append(f"{event['url']}\n")
+                    else:
+                        output_parts.append("\n")
+
+        return "\n".join(output_parts)
+
+    def _generate_output_string(self, structured_events, start_date_utc, end_date_utc, previous_snapshot=None):
         start_date_local = start_date_utc.astimezone(self.display_timezone)
         end_date_local = (end_date_utc - timedelta(days=1)).astimezone(self.display_timezone)
 
@@ -89,14 +238,23 @@ class CalendarFormatter:
 
         date_range_str = f"🗓️ {start_str} ~ {end_str} 일정"
 
-        output_parts = [
+        # 타래 게시물 단위로 나눠서 생성 (첫 안내 글, 지역/타입별 글, 마지막 제보 안내 글)
+        sections = ["\n".join([
             date_range_str,
             "⬇️ 타래로 각 지역의 투쟁 캘린더가 올라갑니다 ⬇️\n"
-        ]
+        ])]
         sorted_regions = sorted(structured_events.keys(),
                                 key=lambda r: self.region_order.index(r) if r in self.region_order else 99)
         region_counter = 1
 
+        # 이전 스냅샷에서 해시가 같은 섹션 본문은 다시 만들지 않고 재사용
+        cached_bodies = {}
+        if previous_snapshot:
+            for section in previous_snapshot.get('sections', {}).values():
+                cached_bodies[section['hash']] = section['body']
+        snapshot_sections = {}
+        reused_count = 0
+
         for region_name in sorted_regions:
             display_region_name = region_name.replace('/', '&')  # 트위터 핸들 문제 방지
             for event_type in ['투쟁', '세미나']:
@@ -115,64 +273,174 @@ class CalendarFormatter:
 
                 week_num = self._get_week_of_month(first_event_time)
                 month = first_event_time.month
-                type_icon = "🔥" if event_type == '투쟁' else "📓"
                 type_text = "투쟁" if event_type == '투쟁' else "세미나"
 
-                output_parts.append(f"({region_counter}) ({display_region_name} {type_text})")
-                output_parts.append(f"{month}월 {week_num}주차 ({display_region_name} {type_text})\n")
-                output_parts.append(f"{type_icon}{type_text}일정 안내{type_icon}\n")
+                # 스냅샷을 쓰지 않으면 해시 계산 없이 바로 생성
+                body = None
+                if self.snapshot_path:
+                    section_hash, event_records = self._section_snapshot(region_name, event_type, week_num, month,
+                                                                         recurring_events, single_events)
+                    body = cached_bodies.get(section_hash)
+                    if body is not None:
+                        reused_count += 1
+                if body is None:
+                    body = self._render_section_body(event_type, display_region_name, week_num, month,
+                                                     recurring_events, single_events)
+
+                sections.append(f"({region_counter}) ({display_region_name} {type_text})\n{body}")
                 region_counter += 1
 
-                if recurring_events:
-                    date_icon = "✊" if event_type == '투쟁' else "📓"
-                    output_parts.append(f"📢 {week_num}주차 반복일정 {date_icon}\n")
-
-                    # 반복 일정은 시작 시간으로 정렬
-                    sorted_recurring = sorted(recurring_events, key=lambda e: e['start_time'])
-
-                    for event in sorted_recurring:
-                        # [수정] 생성된 반복 정보를 그대로 사용
-                        recurrence_text = event.get('recurrence_info', '(반복) ')
-
-                        time_str = ""
-                        if not event['is_all_day']:
-                            time_str = f"{event['start_time'].strftime('%H:%M')} "
-
-                        output_parts.append(f"↓ {event['title']}")
-                        output_parts.append(f"{recurrence_text}{time_str}{event['location']}")
+                if self.snapshot_path:
+                    snapshot_sections[f"{region_name}|{event_type}"] = {
+                        'hash': section_hash,
+                        'body': body,
+                        'events': event_records,
+                    }
+
+        sections.append("\n".join([
+            f"({region_counter})\n\n🎤 투쟁 기자들에게 제보하기 🎤\n",
+            "제보 폼: https://docs.google.com/forms/d/e/1FAIpQLSfr0XK6NPsuXAWHGxJaGv8DALJAAA3rQ8rDv3F3ZWo6hmZUfw/viewform"
+        ]))
+
+        if previous_snapshot:
+            print(f"이전 실행 결과에서 {reused_count}/{len(snapshot_sections)}개 섹션을 재사용했습니다.")
+
+        snapshot = {
+            'version': SNAPSHOT_VERSION,
+            'directory_path': os.path.abspath(self.directory_path),
+            # 조회 구간 [시작, 끝) 을 UTC 기준 분 단위로 저장
+            'range_minutes': [self._utc_minutes(start_date_utc), self._utc_minutes(end_date_utc)],
+            'start_date': start_date_local.strftime('%Y-%m-%d'),
+            'end_date': end_date_local.strftime('%Y-%m-%d'),
+            'sections': snapshot_sections,
+        }
+        self.last_sections = sections
+        return "\n".join(sections), snapshot
 
-                        if event['url']:
-                            output_parts.append(f"{event['url']}\n")
-                        else:
-                            output_parts.append("\n")
+    def _load_snapshot(self):
+        if not self.snapshot_path or not os.path.exists(self.snapshot_path):
+            return None
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+        except (OSError, ValueError) as e:
+            print(f"⚠️  [경고] 이전 실행 스냅샷을 읽지 못해 무시합니다: {e}")
+            return None
 
-                if single_events:
-                    events_by_date = defaultdict(list)
-                    for e in single_events:
-                        events_by_date[e['start_time'].date()].append(e)
-
-                    for date in sorted(events_by_date.keys()):
-                        day_str = self.korean_weekday[date.weekday()]
-                        date_icon = "✊" if event_type == '투쟁' else "📓"
-                        output_parts.append(f"📢 {date.month}월 {date.day}일 ({day_str}) {date_icon}\n")
-
-                        sorted_day_events = sorted(events_by_date[date], key=lambda x: x['start_time'])
-                        for event in sorted_day_events:
-                            output_parts.append(f"↓ {event['title']}")
-                            if event['is_all_day']:
-                                output_parts.append(f"{event['location']}")
-                            else:
-                                output_parts.append(f"{event['start_time'].strftime('%H:%M')} {event['location']}")
-
-                            if event['url']:
-                                output_parts.append(f"{event['url']}\n")
-                            else:
-                                output_parts.append("\n")
-
-        output_parts.append(f"({region_counter})\n\n🎤 투쟁 기자들에게 제보하기 🎤\n")
-        output_parts.append(
-            "제보 폼: https://docs.google.com/forms/d/e/1FAIpQLSfr0XK6NPsuXAWHGxJaGv8DALJAAA3rQ8rDv3F3ZWo6hmZUfw/viewform")
-        return "\n".join(output_parts)
+        if not isinstance(snapshot, dict) or snapshot.get('version') != SNAPSHOT_VERSION:
+            print("이전 실행 스냅샷의 형식이 달라 무시합니다.")
+            return None
+        if not self._is_valid_snapshot(snapshot):
+            print("⚠️  [경고] 이전 실행 스냅샷의 구조가 올바르지 않아 무시합니다.")
+            return None
+        return snapshot
+
+    def _is_valid_snapshot(self, snapshot):
+        """섹션 재사용과 diff에서 읽는 값들이 모두 예상한 타입인지 확인 (파일 손상, 수동 편집 대비)"""
+        if not all(isinstance(snapshot.get(key), str) for key in ('directory_path', 'start_date', 'end_date')):
+            return False
+        range_minutes = snapshot.get('range_minutes')
+        if not (isinstance(range_minutes, list) and len(range_minutes) == 2
+                and all(isinstance(m, int) for m in range_minutes)):
+            return False
+        sections = snapshot.get('sections')
+        if not isinstance(sections, dict):
+            return False
+        for section in sections.values():
+            if not (isinstance(section, dict) and isinstance(section.get('hash'), str)
+                    and isinstance(section.get('body'), str) and isinstance(section.get('events'), list)):
+                return False
+            for record in section['events']:
+                # [제목, 장소, fingerprint, 발생 시각 목록] (_section_snapshot 참고)
+                if not (isinstance(record, list) and len(record) == 4
+                        and isinstance(record[0], str) and isinstance(record[1], str)
+                        and isinstance(record[2], list) and isinstance(record[3], list)
+                        and all(isinstance(m, int) for m in record[3])):
+                    return False
+        return True
+
+    def _save_snapshot(self, snapshot):
+        if not self.snapshot_path:
+            return
+        try:
+            with open(self.snapshot_path, 'w', encoding='utf-8') as f:
+                json.dump(snapshot, f, ensure_ascii=False, indent=2)
+        except OSError as e:
+            print(f"⚠️  [경고] 실행 스냅샷을 저장하지 못했습니다: {e}")
+
+    def _utc_minutes(self, dt):
+        """UTC 시각을 스냅샷에 저장하는 분 단위 정수로 변환 (_section_snapshot과 같은 계산)"""
+        dt = dt.astimezone(pytz.utc)
+        return dt.toordinal() * 1440 + dt.hour * 60 + dt.minute
+
+    def _snapshot_overlap(self, previous_snapshot, snapshot):
+        """두 실행의 조회 구간이 겹치는 [시작, 끝) (UTC 기준 분). 겹치지 않으면 None"""
+        overlap_start = max(previous_snapshot['range_minutes'][0], snapshot['range_minutes'][0])
+        overlap_end = min(previous_snapshot['range_minutes'][1], snapshot['range_minutes'][1])
+        if overlap_start >= overlap_end:
+            return None
+        return overlap_start, overlap_end
+
+    def _diff_snapshots(self, previous_snapshot, snapshot, overlap):
+        """지역/타입별로 추가, 삭제, 변경된 일정을 비교. 두 조회 구간이 겹치는 부분의 발생 건만 비교"""
+        overlap_start, overlap_end = overlap
+
+        def events_in_overlap(section):
+            # 제목과 장소가 같으면 같은 일정으로 간주 (run()의 그룹화 기준과 동일)
+            events = {}
+            for title, location, fingerprint, occurrence_minutes in section.get('events', []):
+                in_overlap = [m for m in occurrence_minutes if overlap_start <= m < overlap_end]
+                if in_overlap:
+                    events[(title, location)] = [fingerprint, in_overlap]
+            return events
+
+        diff = {}
+        previous_sections = previous_snapshot.get('sections', {})
+        current_sections = snapshot['sections']
+        for section_key in list(current_sections) + [k for k in previous_sections if k not in current_sections]:
+            old_events = events_in_overlap(previous_sections.get(section_key, {}))
+            new_events = events_in_overlap(current_sections.get(section_key, {}))
+            added = [k for k in new_events if k not in old_events]
+            removed = [k for k in old_events if k not in new_events]
+            changed = [k for k in new_events if k in old_events and new_events[k] != old_events[k]]
+            if added or removed or changed:
+                diff[section_key] = {'added': added, 'removed': removed, 'changed': changed}
+        return diff
+
+    def _format_diff(self, diff, previous_snapshot, overlap):
+        overlap_start, overlap_end = overlap
+        overlap_str = ' ~ '.join(
+            pytz.utc.localize(datetime.fromordinal(minute // 1440) + timedelta(minutes=minute % 1440))
+            .astimezone(self.display_timezone).strftime('%Y-%m-%d')
+            for minute in (overlap_start, overlap_end - 1))
+        lines = [f"🔁 이전 실행({previous_snapshot.get('start_date')} ~ {previous_snapshot.get('end_date')}) 대비 "
+                 f"변경 사항 (겹치는 기간 {overlap_str} 기준)"]
+        if not diff:
+            lines.append("  변경된 일정이 없습니다.")
+            return "\n".join(lines)
+
+        for section_key, changes in diff.items():
+            region_name, event_type = section_key.split('|')
+            lines.append(f"[{region_name.replace('/', '&')} {event_type}] "
+                         f"+{len(changes['added'])} -{len(changes['removed'])} ~{len(changes['changed'])}")
+            for mark, name in (('+', 'added'), ('-', 'removed'), ('~', 'changed')):
+                for title, location in changes[name]:
+                    lines.append(f"  {mark} {title}" + (f" @ {location}" if location else ""))
+        return "\n".join(lines)
+
+    def _report_diff(self, previous_snapshot, snapshot):
+        """같은 폴더, 겹치는 기간일 때만 이전 실행과 비교해 로그에 출력"""
+        if previous_snapshot.get('directory_path') != snapshot['directory_path']:
+            print("이전 실행과 ICS 폴더가 달라 변경 사항을 비교하지 않습니다.")
+            return
+
+        overlap = self._snapshot_overlap(previous_snapshot, snapshot)
+        if overlap is None:
+            print("⚠️  [경고] 이전 실행과 조회 기간이 겹치지 않아 변경 사항을 비교하지 않습니다.")
+            return
+
+        self.last_diff = self._diff_snapshots(previous_snapshot, snapshot, overlap)
+        print(self._format_diff(self.last_diff, previous_snapshot, overlap))
 
     def run(self, start_date_str=None, end_date_str=None):
         if start_date_str and end_date_str:
@@ -191,8 +459,8 @@ class CalendarFormatter:
             end_date_utc = start_date_utc + timedelta(days=7)
             print("기본값(오늘부터 7일)으로 일정을 검색합니다.")
 
-        # 1. 모든 발생 건을 저장할 임시 리스트
-        all_occurrences = []
+        # 1. 일정(VEVENT)별 (일정 정보, 기간 내 발생 시각(UTC) 목록, RRULE)을 저장할 임시 리스트
+        occurrence_blocks = []
 
         try:
             all_files = os.listdir(self.directory_path)
@@ -262,14 +530,11 @@ class CalendarFormatter:
 
                         try:
                             rule = rrulestr(rrule.to_ical().decode(), dtstart=start_time_for_rule)
-                            # 조회 기간 내 모든 발생 건을 생성
-                            for occurrence_dt in rule.between(start_date_utc,
-                                                              end_date_utc - timedelta(microseconds=1), inc=True):
-                                new_event = event_details.copy()
-                                new_event['start_time'] = occurrence_dt.astimezone(self.display_timezone)
-                                # [수정] RRULE 객체를 이벤트 정보에 추가
-                                new_event['rrule_obj'] = rrule
-                                all_occurrences.append(new_event)
+                            # 조회 기간 내 모든 발생 시각을 생성
+                            occurrence_times = rule.between(start_date_utc,
+                                                            end_date_utc - timedelta(microseconds=1), inc=True)
+                            if occurrence_times:
+                                occurrence_blocks.append((event_details, occurrence_times, rrule))
                         except Exception as rule_error:
                             print(f"⚠️  [경고] '{filename}' 파일의 반복 규칙 처리 중 오류 발생: {rule_error}")
                     else:
@@ -282,53 +547,27 @@ class CalendarFormatter:
                             utc_start_time = dtstart.astimezone(pytz.utc)
 
                         if start_date_utc <= utc_start_time < end_date_utc:
-                            event_details['start_time'] = utc_start_time.astimezone(self.display_timezone)
-                            all_occurrences.append(event_details)
+                            occurrence_blocks.append((event_details, [utc_start_time], None))
 
             except Exception as e:
                 print(f"❌ [오류] '{filename}' 파일 처리 중 문제가 발생했습니다: {e}")
 
-        # 2. 동일한 이벤트를 그룹화
-        grouped_events = defaultdict(list)
-        for event in all_occurrences:
-            # 제목, 장소, 지역, 타입으로 고유한 이벤트를 식별
-            event_key = (event['title'], event['location'], event['region_group'], event['event_type'])
-            grouped_events[event_key].append(event)
-
-        # 3. 그룹화된 이벤트를 '반복'과 '단일'로 최종 분류
-        structured_events = defaultdict(lambda: defaultdict(lambda: {'recurring': [], 'single': []}))
-        for key, occurrences in grouped_events.items():
-            region_group = key[2]
-            event_type = key[3]
-
-            # 발생 횟수가 2번 이상이면 '반복'으로 처리
-            if len(occurrences) >= 2:
-                representative_event = occurrences[0]
-
-                #  RRULE 객체가 있는지 확인하여 반복 정보 생성
-                rrule_obj = representative_event.get('rrule_obj')
-                if rrule_obj:
-                    # RRULE이 있으면 요일 정보로 포맷팅
-                    recurrence_text = self._format_rrule_for_display(rrule_obj)
-                    # 포맷팅 결과가 비어있을 경우, 횟수 정보로 대체
-                    if not recurrence_text.strip():
-                        recurrence_text = f"(기간 내 {len(occurrences)}회 반복) "
-                else:
-                    # RRULE이 없으면 횟수 정보로 표시
-                    recurrence_text = f"(기간 내 {len(occurrences)}회 반복) "
-
-                representative_event['recurrence_info'] = recurrence_text
-                structured_events[region_group][event_type]['recurring'].append(representative_event)
-            # 발생 횟수가 1번이면 '단일'로 처리
-            else:
-                structured_events[region_group][event_type]['single'].append(occurrences[0])
+        # 2~3. 동일한 이벤트를 그룹화하고 '반복'과 '단일'로 분류
+        structured_events = self._group_occurrence_blocks(occurrence_blocks)
 
         if not structured_events:
             message = "선택하신 기간에 해당하는 일정이 없습니다."
             print(message)
             return message
 
-        final_text = self._generate_output_string(structured_events, start_date_utc, end_date_utc)
+        previous_snapshot = self._load_snapshot()
+        final_text, snapshot = self._generate_output_string(structured_events, start_date_utc, end_date_utc,
+                                                            previous_snapshot)
+
+        if previous_snapshot:
+            self._report_diff(previous_snapshot, snapshot)
+        self._save_snapshot(snapshot)
+
         print("\n✅ 작업이 완료되었습니다. 위쪽 창에서 생성된 텍스트를 복사하여 사용하세요.")
         return final_text
 
@@ -21,6 +21,10 @@ def get_base_path():
         return os.path.dirname(os.path.abspath(__file__))
 
 BASE_PATH = get_base_path()
+# 이전 실행 결과와 비교하기 위한 스냅샷 파일
+SNAPSHOT_PATH = os.path.join(BASE_PATH, 'last_run_snapshot.json')
+# 결과 창에 after() 콜백 한 번으로 삽입할 최대 줄 수 (큰 결과도 화면이 멈추지 않도록 나눠서 삽입)
+RESULT_CHUNK_LINES = 100
 
 class TextRedirector:
     """STDOUT, STDERR 출력을 Tkinter Text 위젯으로 리디렉션하는 클래스"""
@@ -51,6 +55,11 @@ class App:
         self.selected_folder_path = StringVar()
         self.selected_folder_path.set("폴더를 선택해주세요.")
 
+        # 결과 창 삽입 상태 (진행 중인 after() 작업, 전체 결과 텍스트, 결과 창에 넣은 복사 버튼)
+        self._result_insert_job = None
+        self._result_full_text = ""
+        self._result_copy_buttons = []
+
         # --- 상단 컨트롤 프레임 ---
         top_frame = Frame(master)
         top_frame.pack(pady=10, padx=10, fill='x')
@@ -92,8 +101,15 @@ class App:
         result_frame = Frame(master, pady=5)
         result_frame.pack(fill='both', expand=True, padx=10)
 
-        result_label = Label(result_frame, text="📋 생성된 텍스트 (복사하여 사용)")
-        result_label.pack(anchor='w')
+        result_label_frame = Frame(result_frame)
+        result_label_frame.pack(fill='x')
+
+        result_label = Label(result_label_frame, text="📋 생성된 텍스트 (게시물별 '복사' 버튼으로 복사하여 사용)")
+        result_label.pack(side='left')
+
+        copy_all_button = Button(result_label_frame, text="전체 복사",
+                                 command=lambda: self._copy_to_clipboard(self._result_full_text, "전체 텍스트"))
+        copy_all_button.pack(side='right')
 
         result_text_frame = Frame(result_frame)
         result_text_frame.pack(fill='both', expand=True)
@@ -157,6 +173,59 @@ class App:
         select_button = Button(top, text="선택", command=set_date)
         select_button.pack(pady=10)
 
+    def _clear_result(self):
+        """진행 중인 결과 삽입을 취소하고 결과 창을 비우는 함수"""
+        if self._result_insert_job is not None:
+            self.master.after_cancel(self._result_insert_job)
+            self._result_insert_job = None
+        self._result_full_text = ""
+        self.result_text.delete(1.0, END)
+        # delete()는 위젯을 지우지 않으므로 복사 버튼을 직접 제거
+        for copy_button in self._result_copy_buttons:
+            copy_button.destroy()
+        self._result_copy_buttons = []
+
+    def _copy_to_clipboard(self, text, name):
+        if not text:
+            return
+        self.master.clipboard_clear()
+        self.master.clipboard_append(text)
+        print(f"{name}을(를) 클립보드에 복사했습니다.")
+
+    def _show_result_sections(self, sections):
+        """
+        생성된 텍스트를 타래 게시물(섹션) 단위로 after() 콜백을 통해 조금씩 결과 창에 삽입하는 함수.
+        한 번에 전체를 삽입하면 긴 결과에서 화면이 멈추므로, 큰 섹션은 RESULT_CHUNK_LINES 줄씩 다시 나눕니다.
+        각 게시물 앞에는 해당 게시물만 복사하는 버튼을 붙입니다.
+        """
+        self._result_full_text = "\n".join(sections)
+
+        # (복사 버튼을 붙일 게시물 번호와 내용 또는 None, 삽입할 텍스트) 목록
+        chunks = []
+        for index, section in enumerate(sections):
+            # 섹션 사이의 줄바꿈을 유지해 결과 창의 전체 텍스트가 생성된 텍스트와 같도록 함
+            lines = (section if index == len(sections) - 1 else section + "\n").splitlines(keepends=True)
+            for start in range(0, max(len(lines), 1), RESULT_CHUNK_LINES):
+                post = (index + 1, section) if start == 0 else None
+                chunks.append((post, "".join(lines[start:start + RESULT_CHUNK_LINES])))
+
+        def insert_next(position):
+            self._result_insert_job = None
+            if position >= len(chunks):
+                return
+
+            post, text = chunks[position]
+            if post is not None:
+                post_number, section = post
+                copy_button = Button(self.result_text, text="📋 복사", padx=2, pady=0, cursor='hand2',
+                                     command=lambda: self._copy_to_clipboard(section, f"{post_number}번째 게시물"))
+                self.result_text.window_create(END, window=copy_button, padx=2)
+                self._result_copy_buttons.append(copy_button)
+            self.result_text.insert(END, text)
+            self._result_insert_job = self.master.after(1, insert_next, position + 1)
+
+        insert_next(0)
+
     def select_folder(self):
         default_path = os.path.join(BASE_PATH, 'data')
         if not os.path.exists(default_path):
@@ -168,7 +237,7 @@ class App:
             self.run_button.config(state='normal')
 
             # 이전 내용 초기화
-            self.result_text.delete(1.0, END)
+            self._clear_result()
             self.log_text.configure(state='normal')
             self.log_text.delete(1.0, END)
             self.log_text.configure(state='disabled')
@@ -182,7 +251,7 @@ class App:
             return
 
         # 이전 내용 초기화
-        self.result_text.delete(1.0, END)
+        self._clear_result()
         self.log_text.configure(state='normal')
         self.log_text.delete(1.0, END)
         self.log_text.configure(state='disabled')
@@ -194,11 +263,12 @@ class App:
         end_date = self.end_date_entry.get()
 
         try:
-            formatter = CalendarFormatter(folder_path, REGION_KEYWORD_MAP, SEMINAR_KEYWORDS)
+            formatter = CalendarFormatter(folder_path, REGION_KEYWORD_MAP, SEMINAR_KEYWORDS,
+                                          snapshot_path=SNAPSHOT_PATH)
             final_text = formatter.run(start_date, end_date)
 
             if final_text:
-                self.result_text.insert(END, final_text)
+                self._show_result_sections(formatter.last_sections or [final_text])
 
         except Exception as e:
             print(f"GUI 처리 중 예외 발생: {e}")
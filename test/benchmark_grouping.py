@@ -0,0 +1,171 @@
+import os
+import random
+import sys
+import timeit
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+import pytz
+from dateutil.rrule import rrulestr
+from icalendar import vRecur
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from calendar_processor import CalendarFormatter
+from config import REGION_KEYWORD_MAP, SEMINAR_KEYWORDS
+
+# --- ⚙️ 설정 ---
+# 비교할 조회 기간(일)과 반복 측정 횟수
+RANGE_DAYS = [1, 3, 7, 14, 30, 90, 180, 365, 730]
+REPEAT = 5
+# 가상 캘린더 구성: 하루 평균 단일 일정 수, 반복 일정(매일/매주) 수
+SINGLE_EVENTS_PER_DAY = 8
+RECURRING_EVENT_COUNT = 60
+# 앞서 만든 일정과 제목/장소/지역/타입이 같은 일정의 비율 (RECURRENCE-ID 예외 일정, 중복 등록 등)
+SHARED_KEY_RATIO = 0.25
+
+
+# -----------------
+
+def make_occurrence_blocks(count_days, start_date_utc):
+    """run()이 .ics 파일에서 만드는 것과 같은 형태의 (일정 정보, 발생 시각 목록, RRULE) 목록을 임의로 생성합니다."""
+    rng = random.Random(0)
+    regions = list(REGION_KEYWORD_MAP.keys())
+    end_date_utc = start_date_utc + timedelta(days=count_days)
+    blocks = []
+
+    def details(title, is_all_day=False):
+        event_details = {
+            'title': title,
+            'location': f"장소 {rng.randrange(50)}",
+            'description': '',
+            'url': f"https://example.com/{rng.randrange(10000)}" if rng.random() < 0.5 else None,
+            'region_group': rng.choice(regions),
+            'event_type': '세미나' if rng.random() < 0.25 else '투쟁',
+            'is_all_day': is_all_day,
+        }
+        # 일부 일정은 앞서 만든 일정과 같은 그룹으로 묶이도록 키를 복사
+        if blocks and rng.random() < SHARED_KEY_RATIO:
+            shared = rng.choice(blocks)[0]
+            for field in ('title', 'location', 'region_group', 'event_type'):
+                event_details[field] = shared[field]
+        return event_details
+
+    for i in range(RECURRING_EVENT_COUNT):
+        rule_text = 'FREQ=DAILY' if i % 3 == 0 else 'FREQ=WEEKLY;BYDAY=MO,WE,FR'
+        dtstart = start_date_utc + timedelta(hours=rng.randrange(24))
+        rule = rrulestr(f"RRULE:{rule_text}", dtstart=dtstart)
+        occurrence_times = rule.between(start_date_utc, end_date_utc - timedelta(microseconds=1), inc=True)
+        if occurrence_times:
+            blocks.append((details(f"반복 일정 {i}"), occurrence_times, vRecur.from_ical(rule_text)))
+
+    for i in range(count_days * SINGLE_EVENTS_PER_DAY):
+        start_time = start_date_utc + timedelta(days=rng.randrange(count_days), hours=rng.randrange(24))
+        blocks.append((details(f"단일 일정 {i}", is_all_day=i % 10 == 0), [start_time], None))
+    return blocks, end_date_utc
+
+
+def copy_blocks(blocks):
+    # 그룹화 과정에서 일정 정보 dict를 수정하므로 매번 새로 복사해서 사용
+    return [(event_details.copy(), occurrence_times, rrule) for event_details, occurrence_times, rrule in blocks]
+
+
+def expand_and_group(formatter, occurrence_blocks):
+    """비교 기준: 발생 건마다 이벤트를 하나씩 만든 뒤 그룹화하던 기존 방식"""
+    all_occurrences = []
+    for event_details, occurrence_times, rrule in occurrence_blocks:
+        if rrule is None:
+            event_details['start_time'] = occurrence_times[0].astimezone(formatter.display_timezone)
+            all_occurrences.append(event_details)
+            continue
+        for occurrence_dt in occurrence_times:
+            new_event = event_details.copy()
+            new_event['start_time'] = occurrence_dt.astimezone(formatter.display_timezone)
+            new_event['rrule_obj'] = rrule
+            all_occurrences.append(new_event)
+
+    grouped_events = defaultdict(list)
+    for event in all_occurrences:
+        event_key = (event['title'], event['location'], event['region_group'], event['event_type'])
+        grouped_events[event_key].append(event)
+
+    structured_events = defaultdict(lambda: defaultdict(lambda: {'recurring': [], 'single': []}))
+    for (_, _, region_group, event_type), occurrences in grouped_events.items():
+        if len(occurrences) >= 2:
+            representative_event = occurrences[0]
+            representative_event['recurrence_info'] = formatter._recurrence_text(representative_event,
+                                                                                 len(occurrences))
+            structured_events[region_group][event_type]['recurring'].append(representative_event)
+        else:
+            structured_events[region_group][event_type]['single'].append(occurrences[0])
+    return structured_events
+
+
+def python_sort_and_weeks(formatter, representative_events):
+    """출력 단계와 같은 방식: 시작 시간 정렬 + 일정별 주차 계산"""
+    sorted_events = sorted(representative_events, key=lambda e: e['start_time'])
+    return [formatter._get_week_of_month(e['start_time']) for e in sorted_events]
+
+
+def numpy_sort_and_weeks(representative_events):
+    """NumPy 후보: datetime64 배열로 정렬 + 주차 계산"""
+    start_times = np.array([e['start_time'].replace(tzinfo=None) for e in representative_events],
+                           dtype='datetime64[us]')
+    dates = start_times[np.argsort(start_times, kind='stable')].astype('datetime64[D]')
+    month_starts = dates.astype('datetime64[M]').astype('datetime64[D]')
+    # 1970-01-01은 목요일(월요일=0 기준 3)
+    first_weekday = (month_starts.astype(np.int64) + 3) % 7
+    day_index = (dates - month_starts).astype(np.int64)
+    return ((day_index + first_weekday) // 7 + 1).tolist()
+
+
+def benchmark():
+    formatter = CalendarFormatter('', REGION_KEYWORD_MAP, SEMINAR_KEYWORDS)
+    start_date_utc = datetime(2025, 1, 1, tzinfo=pytz.utc)
+
+    def measure(function):
+        return min(timeit.repeat(function, number=1, repeat=REPEAT)) * 1000
+
+    print("그룹화: 발생 건을 펼치는 기존 방식 vs _group_occurrence_blocks (ms)")
+    if np is not None:
+        print("정렬+주차: 대표 일정 기준 Python vs NumPy (ms)")
+    print(f"\n{'기간(일)':>8} | {'발생 건':>8} | {'펼침':>8} | {'집계':>8} | {'정렬+주차 Py':>12} | {'NumPy':>8}")
+    print("-" * 70)
+
+    for count_days in RANGE_DAYS:
+        blocks, end_date_utc = make_occurrence_blocks(count_days, start_date_utc)
+        occurrence_count = sum(len(occurrence_times) for _, occurrence_times, _ in blocks)
+
+        expected = formatter._generate_output_string(expand_and_group(formatter, copy_blocks(blocks)),
+                                                     start_date_utc, end_date_utc)[0]
+        structured_events = formatter._group_occurrence_blocks(copy_blocks(blocks))
+        if formatter._generate_output_string(structured_events, start_date_utc, end_date_utc)[0] != expected:
+            print(f"❌ [오류] {count_days}일 기간에서 두 그룹화 방식의 출력이 다릅니다.")
+            return
+
+        expand_time = measure(lambda: expand_and_group(formatter, copy_blocks(blocks)))
+        group_time = measure(lambda: formatter._group_occurrence_blocks(copy_blocks(blocks)))
+
+        representative_events = [event for region_events in structured_events.values()
+                                 for typed_events in region_events.values()
+                                 for events in typed_events.values() for event in events]
+        python_weeks_time = measure(lambda: python_sort_and_weeks(formatter, representative_events))
+        numpy_weeks_text = "-"
+        if np is not None:
+            if numpy_sort_and_weeks(representative_events) != python_sort_and_weeks(formatter,
+                                                                                     representative_events):
+                print(f"❌ [오류] {count_days}일 기간에서 NumPy 주차 계산 결과가 다릅니다.")
+                return
+            numpy_weeks_text = f"{measure(lambda: numpy_sort_and_weeks(representative_events)):.2f}"
+
+        print(f"{count_days:>8} | {occurrence_count:>8} | {expand_time:>8.2f} | {group_time:>8.2f} | "
+              f"{python_weeks_time:>12.2f} | {numpy_weeks_text:>8}")
+
+
+if __name__ == '__main__':
+    benchmark()
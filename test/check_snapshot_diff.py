@@ -0,0 +1,153 @@
+import contextlib
+import io
+import json
+import os
+import re
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from calendar_processor import SNAPSHOT_VERSION, CalendarFormatter
+from config import REGION_KEYWORD_MAP, SEMINAR_KEYWORDS
+
+# --- ⚙️ 설정 ---
+# 검사에 사용할 조회 기간
+START_DATE = '2026-03-02'
+END_DATE = '2026-03-15'
+
+# 검사용 캘린더: 파일명 -> (캘린더 이름, [(제목, 시작(UTC), 장소, RRULE)])
+FIXTURE_CALENDARS = {
+    'seoul.ics': ('서울 투쟁 캘린더', [
+        ('서울 집회', '20260303T010000Z', '광화문', None),
+        ('서울 행진', '20260305T050000Z', '시청', None),
+        ('서울 기자회견', '20260310T020000Z', '국회', None),
+        ('서울 정기 선전전', '20260302T080000Z', '종각', 'FREQ=WEEKLY;BYDAY=MO'),
+        # 제목과 장소가 같은 일정 두 개 -> '(기간 내 2회 반복)'으로 묶임
+        ('서울 농성', '20260306T010000Z', '국회 앞', None),
+        ('서울 농성', '20260312T010000Z', '국회 앞', None),
+    ]),
+    'gangwon.ics': ('강원 캘린더', [
+        ('강원 집회', '20260304T030000Z', '춘천', None),
+        ('강원 세미나', '20260311T090000Z', '원주', None),
+    ]),
+}
+
+# 재실행 전에 바꿀 일정: (파일명, 바꾸기 전 DTSTART, 바꾼 후 DTSTART)
+CHANGED_EVENT = ('seoul.ics', '20260305T050000Z', '20260305T070000Z')
+# 묶인 반복 일정 중 발생 건 하나만 옮기는 경우
+MOVED_OCCURRENCE = ('seoul.ics', '20260312T010000Z', '20260313T010000Z')
+
+# ICS는 그대로 두고 조회 기간만 바꿔 가며 실행할 기간들 (모두 변경 없음이어야 함)
+SHIFTED_RANGES = [('2026-03-02', '2026-03-08'), ('2026-03-02', '2026-03-15'), ('2026-03-09', '2026-03-15')]
+
+# 구조가 잘못된 스냅샷 (파일 손상, 수동 편집 등). dict에는 현재 버전을 넣어 구조 검사까지 가도록 함.
+# 모두 스냅샷 없이 실행한 것처럼 처리되어야 함
+CORRUPT_SNAPSHOTS = [
+    [],
+    {},
+    {'directory_path': '', 'range_minutes': [0, 1], 'start_date': '', 'end_date': ''},
+    {'directory_path': '', 'range_minutes': [0, 1], 'start_date': '', 'end_date': '',
+     'sections': {'서울|투쟁': {'hash': 'x', 'body': 'x', 'events': [['서울 집회', '광화문']]}}},
+]
+
+
+# -----------------
+
+def write_fixture(directory_path):
+    """검사용 .ics 파일들을 만듭니다."""
+    for filename, (cal_name, events) in FIXTURE_CALENDARS.items():
+        lines = ['BEGIN:VCALENDAR', 'VERSION:2.0', f'X-WR-CALNAME:{cal_name}']
+        for index, (summary, dtstart, location, rrule) in enumerate(events):
+            lines += ['BEGIN:VEVENT', f'UID:{filename}-{index}', f'SUMMARY:{summary}', f'DTSTART:{dtstart}',
+                      f'LOCATION:{location}']
+            if rrule:
+                lines.append(f'RRULE:{rrule}')
+            lines.append('END:VEVENT')
+        lines.append('END:VCALENDAR')
+        with open(os.path.join(directory_path, filename), 'w', encoding='utf-8') as f:
+            f.write('\r\n'.join(lines))
+
+
+def replace_in_file(file_path, old, new):
+    with open(file_path, 'r', encoding='utf-8') as f:
+        content = f.read()
+    with open(file_path, 'w', encoding='utf-8') as f:
+        f.write(content.replace(old, new))
+
+
+def run_formatter(directory_path, snapshot_path, start_date=START_DATE, end_date=END_DATE):
+    """한 번 실행하고 (생성된 텍스트, diff, 재사용한 섹션 수, 전체 섹션 수)를 반환합니다."""
+    formatter = CalendarFormatter(directory_path, REGION_KEYWORD_MAP, SEMINAR_KEYWORDS, snapshot_path=snapshot_path)
+    log = io.StringIO()
+    with contextlib.redirect_stdout(log):
+        final_text = formatter.run(start_date, end_date)
+
+    reused_match = re.search(r'이전 실행 결과에서 (\d+)/(\d+)개 섹션을 재사용했습니다', log.getvalue())
+    reused = tuple(map(int, reused_match.groups())) if reused_match else (None, None)
+    return final_text, formatter.last_diff, reused[0], reused[1]
+
+
+def check_snapshot_diff():
+    print("🔍 스냅샷 저장/재사용과 변경 사항 비교를 검사합니다...\n")
+
+    with tempfile.TemporaryDirectory() as directory_path:
+        write_fixture(directory_path)
+        snapshot_path = os.path.join(directory_path, 'snapshot.json')
+
+        # 1. 첫 실행: 비교할 스냅샷이 없음
+        first_text, diff, reused, _ = run_formatter(directory_path, snapshot_path)
+        assert os.path.exists(snapshot_path), "스냅샷 파일이 저장되지 않았습니다."
+        assert diff is None and reused is None, "첫 실행에서 비교가 수행되었습니다."
+        print("* 첫 실행: 스냅샷 저장 확인")
+
+        # 2. 변경 없이 다시 실행: 모든 섹션 재사용, 변경 없음
+        second_text, diff, reused, total = run_formatter(directory_path, snapshot_path)
+        assert second_text == first_text, "재사용한 결과가 처음 생성한 텍스트와 다릅니다."
+        assert reused == total == 3, f"섹션 재사용 수가 예상과 다릅니다: {reused}/{total}"
+        assert diff == {}, f"변경이 없는데 diff가 있습니다: {diff}"
+        print(f"* 변경 없이 재실행: {reused}/{total}개 섹션 재사용, 변경 없음 확인")
+
+        # 3. 일정 하나의 시간을 바꾸고 실행: 해당 섹션만 다시 생성, 변경으로 분류
+        filename, old_dtstart, new_dtstart = CHANGED_EVENT
+        replace_in_file(os.path.join(directory_path, filename), old_dtstart, new_dtstart)
+
+        third_text, diff, reused, total = run_formatter(directory_path, snapshot_path)
+        assert third_text != second_text, "바뀐 일정이 결과에 반영되지 않았습니다."
+        assert (reused, total) == (2, 3), f"섹션 재사용 수가 예상과 다릅니다: {reused}/{total}"
+        expected_diff = {'서울|투쟁': {'added': [], 'removed': [], 'changed': [('서울 행진', '시청')]}}
+        assert diff == expected_diff, f"diff가 예상과 다릅니다: {diff}"
+        print(f"* 일정 변경 후 재실행: {reused}/{total}개 섹션 재사용, 변경 일정 분류 확인")
+
+        # 4. 묶인 반복 일정의 발생 건 하나만 옮기고 실행: 해당 일정이 변경으로 분류
+        filename, old_dtstart, new_dtstart = MOVED_OCCURRENCE
+        replace_in_file(os.path.join(directory_path, filename), old_dtstart, new_dtstart)
+
+        _, diff, _, _ = run_formatter(directory_path, snapshot_path)
+        expected_diff = {'서울|투쟁': {'added': [], 'removed': [], 'changed': [('서울 농성', '국회 앞')]}}
+        assert diff == expected_diff, f"diff가 예상과 다릅니다: {diff}"
+        print("* 반복 일정의 발생 건 이동 후 재실행: 변경 일정 분류 확인")
+
+        # 5. ICS는 그대로 두고 조회 기간만 바꿔 가며 실행: 반복/단일 분류가 바뀌어도 변경 없음
+        for start_date, end_date in SHIFTED_RANGES:
+            _, diff, _, _ = run_formatter(directory_path, snapshot_path, start_date, end_date)
+            assert diff == {}, f"{start_date} ~ {end_date}: 조회 기간만 바꿨는데 diff가 있습니다: {diff}"
+        print("* 조회 기간만 바꿔 재실행: 변경 없음 확인")
+
+        # 6. 구조가 잘못된 스냅샷: 오류 없이 스냅샷 없이 실행한 것과 같은 결과
+        expected_text, _, _, _ = run_formatter(directory_path, snapshot_path)
+        for corrupt_snapshot in CORRUPT_SNAPSHOTS:
+            if isinstance(corrupt_snapshot, dict):
+                corrupt_snapshot = dict(corrupt_snapshot, version=SNAPSHOT_VERSION)
+            with open(snapshot_path, 'w', encoding='utf-8') as f:
+                json.dump(corrupt_snapshot, f)
+            text, diff, reused, _ = run_formatter(directory_path, snapshot_path)
+            assert text == expected_text, f"잘못된 스냅샷에서 결과가 달라졌습니다: {corrupt_snapshot}"
+            assert diff is None and reused is None, f"잘못된 스냅샷이 사용되었습니다: {corrupt_snapshot}"
+        print("* 구조가 잘못된 스냅샷: 무시하고 정상 생성 확인")
+
+    print("\n✅ 모든 검사를 통과했습니다.")
+
+
+if __name__ == '__main__':
+    check_snapshot_diff()